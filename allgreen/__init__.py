@@ -1,3 +1,6 @@
+import importlib
+import importlib.util
+
 from .config import ConfigLoader, find_config, load_config
 from .core import (
     AllgreenError,
@@ -33,31 +36,61 @@ __all__ = [
     "ConfigLoader",
 ]
 
-# Try to import web framework integrations (optional)
-try:
-    from .integrations.flask_integration import (  # noqa: F401
-        HealthCheckApp,
-        create_app,
-        mount_healthcheck,
-        run_standalone,
-    )
-    __all__.extend([
-        "create_app",
-        "mount_healthcheck",
-        "run_standalone",
-        "HealthCheckApp",
-    ])
-except ImportError:
-    pass
-
-try:
-    from .integrations import django_integration  # noqa: F401
-    __all__.append("django_integration")
-except ImportError:
-    pass
-
-try:
-    from .integrations import fastapi_integration  # noqa: F401
-    __all__.append("fastapi_integration")
-except ImportError:
-    pass
+# Web framework integrations (optional) are imported on first access, so
+# `import allgreen` does not pull in Flask, Django or FastAPI.
+_LAZY_ATTRIBUTES = {
+    "create_app": ("flask_integration", "create_app"),
+    "mount_healthcheck": ("flask_integration", "mount_healthcheck"),
+    "run_standalone": ("flask_integration", "run_standalone"),
+    "HealthCheckApp": ("flask_integration", "HealthCheckApp"),
+    "django_integration": ("django_integration", None),
+    "fastapi_integration": ("fastapi_integration", None),
+}
+
+# Third-party packages each integration module needs
+_INTEGRATION_REQUIREMENTS = {
+    "flask_integration": ("flask",),
+    "django_integration": ("django",),
+    "fastapi_integration": ("fastapi", "anyio", "jinja2"),
+}
+
+# Probe for installed frameworks without importing them (a failed import
+# costs far more than a spec lookup)
+_AVAILABLE_INTEGRATIONS = {
+    module_name
+    for module_name, requirements in _INTEGRATION_REQUIREMENTS.items()
+    if all(importlib.util.find_spec(package) for package in requirements)
+}
+
+__all__.extend(
+    name
+    for name, (module_name, _) in _LAZY_ATTRIBUTES.items()
+    if module_name in _AVAILABLE_INTEGRATIONS
+)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    if module_name not in _AVAILABLE_INTEGRATIONS:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} "
+            f"(requires: {', '.join(_INTEGRATION_REQUIREMENTS[module_name])})"
+        )
+
+    try:
+        module = importlib.import_module(f".integrations.{module_name}", __name__)
+    except ImportError as e:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r} ({e})"
+        ) from e
+
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
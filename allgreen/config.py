@@ -1,6 +1,12 @@
 import os
+import threading
 
-from .core import get_registry
+from .core import Check, get_registry
+
+# (config file, environment) -> (mtime_ns, checks registered by that load).
+# Lets repeated loads of an unchanged config skip re-executing it.
+_load_cache: dict[tuple[str, str], tuple[int, list[Check]]] = {}
+_load_lock = threading.Lock()
 
 
 class ConfigLoader:
@@ -38,9 +44,31 @@ class ConfigLoader:
         except FileNotFoundError:
             return False
 
+        with _load_lock:
+            return self._load_config_file(config_file, environment)
+
+    def _load_config_file(self, config_file: str, environment: str) -> bool:
+        """Execute config_file unless it is unchanged since it was last loaded."""
+        registry = get_registry()
+        cache_key = (config_file, environment)
+        try:
+            mtime_ns = os.stat(config_file).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+
+        # Skip re-executing an unchanged config whose checks are still registered
+        cached = _load_cache.get(cache_key)
+        if (
+            cached is not None
+            and cached[0] == mtime_ns
+            and registry.get_checks() == cached[1]
+        ):
+            self._loaded_path = config_file
+            return True
+
         # Clear existing checks if reloading
         if self._loaded_path != config_file:
-            get_registry().clear()
+            registry.clear()
 
         try:
             # Import DSL functions locally to avoid circular imports
@@ -64,6 +92,8 @@ class ConfigLoader:
                 exec(code, namespace)
 
             self._loaded_path = config_file
+            if mtime_ns is not None:
+                _load_cache[cache_key] = (mtime_ns, registry.get_checks())
             return True
 
         except Exception as e:
@@ -1,30 +1,39 @@
-import signal
+import contextvars
+import os
+import sys
 import threading
 import time
 import traceback
 from collections.abc import Callable
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
-from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+# asyncio.timeout() (3.11+) cancels the awaited future in place instead of
+# wrapping it in a new Task the way asyncio.wait_for() does on older versions.
+_HAS_ASYNCIO_TIMEOUT = sys.version_info >= (3, 11)
+
+
+class CheckStatus(str, Enum):
+    """Outcome of a check. Members compare equal to their string values."""
 
-class CheckStatus(Enum):
     PASSED = "passed"
     FAILED = "failed"
     SKIPPED = "skipped"
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     status: CheckStatus
     message: str | None = None
     error: str | None = None
     duration_ms: float | None = None
     skip_reason: str | None = None
+    # Served from the rate limit cache rather than run for this request
+    cached: bool = False
 
     @property
     def passed(self) -> bool:
@@ -51,15 +60,89 @@ class CheckTimeoutError(AllgreenError):
     pass
 
 
+# Shared worker pool for running check functions under a timeout. Workers
+# are reused across checks; a check that times out keeps its worker busy
+# until it returns, but the caller is released as soon as the timeout hits.
+_POOL_SIZE = min(32, (os.cpu_count() or 1) + 4)
+_executor = ThreadPoolExecutor(
+    max_workers=_POOL_SIZE,
+    thread_name_prefix="allgreen_timeout",
+)
+# Number of calls submitted to _executor that have not returned yet
+_pool_busy = 0
+_pool_lock = threading.Lock()
+
+
+def _release_pool_slot(future: Future) -> None:
+    """Free a pool slot once its call returns, raises or is cancelled."""
+    global _pool_busy
+    with _pool_lock:
+        _pool_busy -= 1
+
+
+def _run_in_thread(func: Callable) -> Future:
+    """Run func on a new daemon thread, reporting through a Future."""
+    future: Future = Future()
+    context = contextvars.copy_context()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = context.run(func)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    threading.Thread(target=run, name="allgreen_timeout_overflow", daemon=True).start()
+    return future
+
+
+def _submit(func: Callable) -> Future:
+    """
+    Start func immediately on a worker thread.
+
+    Uses the shared pool while it has a free worker. Once every worker is
+    busy (for example with checks that hung and were abandoned after
+    timing out) calls get a dedicated thread instead, so new checks never
+    queue behind stuck ones and their timeout only covers their own run.
+    func runs in a copy of the caller's context, so context variables
+    (e.g. Flask's application context) stay visible to checks.
+    """
+    global _pool_busy
+    with _pool_lock:
+        use_pool = _pool_busy < _POOL_SIZE
+        if use_pool:
+            _pool_busy += 1
+
+    if not use_pool:
+        return _run_in_thread(func)
+
+    try:
+        future = _executor.submit(contextvars.copy_context().run, func)
+    except BaseException:
+        with _pool_lock:
+            _pool_busy -= 1
+        raise
+    future.add_done_callback(_release_pool_slot)
+    return future
+
+
+def _timeout_error(timeout_seconds: float) -> CheckTimeoutError:
+    """Build the timeout error shared by the sync and async execution paths."""
+    return CheckTimeoutError(f"Check timed out after {timeout_seconds:g} seconds")
+
+
 def execute_with_robust_timeout(func: Callable, timeout_seconds: float) -> Any:
     """
     Execute function with robust timeout enforcement.
 
-    Uses worker thread execution with hard timeout that can interrupt
-    most blocking operations including network calls, file I/O, etc.
-
-    This is more reliable than signal-based or timer-flag approaches
-    for truly blocking operations.
+    Runs func on a worker thread (from a shared pool, or a dedicated thread
+    when the pool is saturated) and waits for its result with a hard
+    timeout, so blocking operations (network calls, file I/O, C extensions)
+    cannot hold up the caller past the deadline. Unlike a SIGALRM-based
+    approach this works on all platforms and from any thread.
 
     Args:
         func: Function to execute
@@ -75,21 +158,13 @@ def execute_with_robust_timeout(func: Callable, timeout_seconds: float) -> Any:
     if timeout_seconds <= 0:
         return func()
 
-    # For very short timeouts or main thread + Unix, use signals (fastest)
-    is_main_thread = threading.current_thread() is threading.main_thread()
-    if hasattr(signal, 'SIGALRM') and is_main_thread and timeout_seconds >= 0.1:
-        # Signal-based timeout for quick execution in main thread
-        with timeout_context(int(timeout_seconds) or 1):
-            return func()
-    else:
-        # Worker thread with hard timeout for robust interruption
-        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="allgreen_timeout") as executor:
-            future = executor.submit(func)
-            try:
-                return future.result(timeout=timeout_seconds)
-            except FutureTimeoutError:
-                # The worker thread will be abandoned and eventually cleaned up
-                raise CheckTimeoutError(f"Check timed out after {timeout_seconds:.1f} seconds") from None
+    future = _submit(func)
+    try:
+        return future.result(timeout=timeout_seconds)
+    except FutureTimeoutError:
+        # Drop the call if it never started; a running worker is abandoned
+        future.cancel()
+        raise _timeout_error(timeout_seconds) from None
 
 
 async def execute_with_async_timeout(func: Callable, timeout_seconds: float) -> Any:
@@ -106,54 +181,14 @@ async def execute_with_async_timeout(func: Callable, timeout_seconds: float) ->
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(None, func)
 
-    loop = asyncio.get_running_loop()
-
-    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="allgreen_async") as executor:
-        try:
-            return await asyncio.wait_for(
-                loop.run_in_executor(executor, func),
-                timeout=timeout_seconds
-            )
-        except asyncio.TimeoutError:
-            raise CheckTimeoutError(f"Check timed out after {timeout_seconds:.1f} seconds") from None
-
-
-@contextmanager
-def timeout_context(seconds: int):
-    """Context manager for timing out function execution."""
-    # Check if we're in the main thread and signals are available
-    is_main_thread = threading.current_thread() is threading.main_thread()
-
-    if hasattr(signal, 'SIGALRM') and is_main_thread:
-        # Unix systems in main thread - use signals (more reliable)
-        def timeout_handler(signum, frame):
-            raise CheckTimeoutError(f"Check timed out after {seconds} seconds")
-
-        old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-        signal.alarm(seconds)
-        try:
-            yield
-        finally:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
-    else:
-        # Threading-based timeout (works in all threads and systems)
-        timer_expired = threading.Event()
-
-        def timeout_func():
-            timer_expired.set()
-
-        timer = threading.Timer(seconds, timeout_func)
-        timer.start()
-
-        try:
-            start_time = time.time()
-            yield
-            # Check if we timed out during execution
-            if timer_expired.is_set() or (time.time() - start_time) >= seconds:
-                raise CheckTimeoutError(f"Check timed out after {seconds} seconds")
-        finally:
-            timer.cancel()
+    future = asyncio.wrap_future(_submit(func))
+    try:
+        if _HAS_ASYNCIO_TIMEOUT:
+            async with asyncio.timeout(timeout_seconds):
+                return await future
+        return await asyncio.wait_for(future, timeout=timeout_seconds)
+    except asyncio.TimeoutError:
+        raise _timeout_error(timeout_seconds) from None
 
 
 class Expectation:
@@ -189,6 +224,16 @@ def make_sure(condition: Any, message: str | None = None) -> None:
 
 
 class Check:
+    __slots__ = (
+        "description",
+        "func",
+        "timeout",
+        "only_in",
+        "except_in",
+        "if_condition",
+        "run",
+    )
+
     def __init__(
         self,
         description: str,
@@ -261,7 +306,8 @@ class Check:
                         message=cached_message,
                         error=cached_result.get('error'),
                         duration_ms=cached_result.get('duration_ms', 0),
-                        skip_reason=None  # Not actually skipped, just cached
+                        skip_reason=None,  # Not actually skipped, just cached
+                        cached=True,
                     )
                 else:
                     return CheckResult(
@@ -269,12 +315,12 @@ class Check:
                         skip_reason=skip_reason_rate
                     )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             # Execute with robust timeout enforcement
             execute_with_robust_timeout(self.func, self.timeout)
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.PASSED,
                 message="Check passed",
@@ -288,7 +334,7 @@ class Check:
             return result
 
         except CheckTimeoutError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.ERROR,
                 error=str(e),
@@ -300,7 +346,7 @@ class Check:
             return result
 
         except CheckAssertionError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.FAILED,
                 message=str(e),
@@ -311,7 +357,7 @@ class Check:
             return result
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.ERROR,
                 error=f"{type(e).__name__}: {e}",
@@ -353,7 +399,8 @@ class Check:
                         message=cached_message,
                         error=cached_result.get('error'),
                         duration_ms=cached_result.get('duration_ms', 0),
-                        skip_reason=None  # Not actually skipped, just cached
+                        skip_reason=None,  # Not actually skipped, just cached
+                        cached=True,
                     )
                 else:
                     return CheckResult(
@@ -361,12 +408,12 @@ class Check:
                         skip_reason=skip_reason_rate
                     )
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
             # Execute with async timeout enforcement
             await execute_with_async_timeout(self.func, self.timeout)
 
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.PASSED,
                 message="Check passed",
@@ -380,7 +427,7 @@ class Check:
             return result
 
         except CheckTimeoutError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.ERROR,
                 error=str(e),
@@ -392,7 +439,7 @@ class Check:
             return result
 
         except CheckAssertionError as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.FAILED,
                 message=str(e),
@@ -403,7 +450,7 @@ class Check:
             return result
 
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
             result = CheckResult(
                 status=CheckStatus.ERROR,
                 error=f"{type(e).__name__}: {e}",
@@ -420,14 +467,21 @@ class Check:
             return True, None, None
 
         # Import locally to avoid circular imports
-        from .rate_limiting import RateLimitConfig, get_rate_tracker
+        from .rate_limiting import (
+            ENVIRONMENT_SEPARATOR,
+            RateLimitConfig,
+            get_rate_tracker,
+        )
 
         try:
             config = RateLimitConfig(self.run)
             tracker = get_rate_tracker()
 
             # Create a namespaced key to avoid collisions between environments
-            check_key = f"{environment}::{self.description}" if environment else self.description
+            check_key = (
+                f"{environment}{ENVIRONMENT_SEPARATOR}{self.description}"
+                if environment else self.description
+            )
 
             return tracker.should_run_check(check_key, config)
         except ValueError:
@@ -439,11 +493,11 @@ class Check:
         if not self.run:
             return
 
-        from .rate_limiting import get_rate_tracker
+        from .rate_limiting import ENVIRONMENT_SEPARATOR, get_rate_tracker
 
-        # Convert CheckResult to dict for caching
+        # Convert CheckResult to plain values for caching
         result_dict = {
-            "status": result.status,
+            "status": result.status.value,
             "message": result.message,
             "error": result.error,
             "duration_ms": result.duration_ms,
@@ -452,14 +506,18 @@ class Check:
         tracker = get_rate_tracker()
 
         # Use the same namespaced key as _check_rate_limit
-        check_key = f"{environment}::{self.description}" if environment else self.description
+        check_key = (
+            f"{environment}{ENVIRONMENT_SEPARATOR}{self.description}"
+            if environment else self.description
+        )
 
         tracker.record_result(check_key, result_dict)
 
 
 class CheckRegistry:
-    def __init__(self):
+    def __init__(self, max_concurrency: int = 10):
         self._checks: list[Check] = []
+        self.max_concurrency = max_concurrency
 
     def register(self, check: Check) -> None:
         self._checks.append(check)
@@ -471,24 +529,46 @@ class CheckRegistry:
         self._checks.clear()
 
     def run_all(self, environment: str = "development") -> list[tuple[Check, CheckResult]]:
-        results = []
-        for check in self._checks:
-            result = check.execute(environment)
-            results.append((check, result))
-        return results
+        """
+        Run all checks concurrently, at most max_concurrency at a time.
+
+        Each check's timeout covers only its own execution: checks never
+        wait for a free worker, even when max_concurrency exceeds the
+        shared timeout pool. Checks see the caller's context variables.
+        Results are returned in registration order.
+        """
+        checks = self._checks.copy()
+        if len(checks) <= 1 or self.max_concurrency <= 1:
+            return [(check, check.execute(environment)) for check in checks]
+
+        # Separate from the timeout pool: each check waits on that pool itself
+        max_workers = min(self.max_concurrency, len(checks))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="allgreen_run") as executor:
+            # One context copy per check: a Context can't be entered by two threads
+            futures = [
+                executor.submit(contextvars.copy_context().run, check.execute, environment)
+                for check in checks
+            ]
+            return [(check, future.result()) for check, future in zip(checks, futures, strict=True)]
 
     async def run_all_async(self, environment: str = "development") -> list[tuple[Check, CheckResult]]:
         """
         Run all checks asynchronously without blocking the event loop.
 
         Essential for ASGI applications like FastAPI. Each check runs in
-        a worker thread with robust timeout enforcement.
+        a worker thread with robust timeout enforcement; up to
+        max_concurrency checks run at once. Results are returned in
+        registration order.
         """
-        results = []
-        for check in self._checks:
-            result = await check.execute_async(environment)
-            results.append((check, result))
-        return results
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def run_one(check: Check) -> tuple[Check, CheckResult]:
+            async with semaphore:
+                return check, await check.execute_async(environment)
+
+        return list(await asyncio.gather(*(run_one(check) for check in self._checks)))
 
 
 # Global registry
@@ -0,0 +1,51 @@
+"""HTTP caching helpers shared by the framework integrations."""
+
+import hashlib
+
+# Failing responses must never be stored. Passing responses carry an ETag, so
+# let clients keep them but revalidate on every request.
+NO_STORE_CACHE_CONTROL = "no-store, no-cache, must-revalidate, max-age=0"
+REVALIDATE_CACHE_CONTROL = "no-cache, must-revalidate, private"
+
+
+def compute_etag(results, overall_status, app_name, environment, timestamp, wants_json):
+    """
+    Compute a weak ETag for a health check response, or None if it has none.
+
+    Only passing responses where no check actually ran for this request
+    (every result was served from the rate limit cache or skipped) get an
+    ETag. A check that ran has a fresh duration, so its page would never
+    match an earlier one. The key covers everything that is rendered,
+    durations and timestamp included, so equal ETags mean equal bodies.
+    """
+    if overall_status != "passed":
+        return None
+    if not all(result.cached or result.skipped for _, result in results):
+        return None
+
+    key = repr((
+        "json" if wants_json else "html",
+        overall_status,
+        app_name,
+        environment,
+        timestamp,
+        [
+            (check.description, result.status.value, result.message,
+             result.error, result.duration_ms, result.skip_reason)
+            for check, result in results
+        ],
+    ))
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=16).hexdigest()}"'
+
+
+def etag_matches(if_none_match, etag):
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
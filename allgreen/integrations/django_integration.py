@@ -10,6 +10,28 @@ Setup:
 
     2. Create health checks in allgreen_config.py file in your project root
        Note: Use absolute imports only. Relative imports are not supported.
+       To render the health check page with Jinja2 (faster) instead of
+       Django templates, configure a Jinja2 backend in TEMPLATES and set
+       ALLGREEN_USE_JINJA2 = True. The page is then looked up as
+       'allgreen/healthcheck.html' through that backend, falling back to the
+       bundled Jinja2 template when the project does not override it.
+
+    3. (Optional) Keep compiled templates in memory. Django wraps the default
+       loaders in the cached loader when 'loaders' is not set (always on
+       Django 4.1+, only with DEBUG=False before that). If you list loaders
+       yourself, wrap them explicitly (APP_DIRS must then be left unset):
+        TEMPLATES = [{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'OPTIONS': {
+                'loaders': [
+                    ('django.template.loaders.cached.Loader', [
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ]),
+                ],
+            },
+        }]
+       Template edits are then only picked up after a restart.
 
 Usage:
     # In urls.py
@@ -17,6 +39,8 @@ Usage:
 
     urlpatterns = [
         path('healthcheck/', django_integration.healthcheck_view, name='healthcheck'),
+        # JSON only, skips template rendering (for load balancers and probes)
+        path('healthcheck.json', django_integration.healthcheck_view),
     ]
 
     # Or use as class-based view
@@ -25,22 +49,37 @@ Usage:
     ]
 """
 
+import os
 from datetime import datetime
 
 try:
+    from django.conf import settings
     from django.http import HttpRequest, HttpResponse, JsonResponse
-    from django.template.loader import render_to_string
-    from django.utils.decorators import method_decorator
+    from django.template import TemplateDoesNotExist, engines
+    from django.template.loader import get_template
+    from django.utils.cache import get_conditional_response
     from django.views import View
-    from django.views.decorators.cache import never_cache
 except ImportError:
     raise ImportError(
         "Django is required for django_integration. "
         "Install with: pip install allgreen[django]"
     ) from None
 
+import allgreen
+
 from ..config import load_config
 from ..core import CheckStatus, get_registry
+from .caching import NO_STORE_CACHE_CONTROL, REVALIDATE_CACHE_CONTROL, compute_etag
+
+# Jinja2 version of the shared template (also used by Flask and FastAPI)
+_JINJA2_TEMPLATE_PATH = os.path.join(
+    os.path.dirname(allgreen.__file__), 'templates', 'healthcheck.html'
+)
+
+
+# Resolved lazily on first render: settings and app registry may not be ready
+# when this module is imported.
+_healthcheck_template = None
 
 
 class HealthCheckView(View):
@@ -57,10 +96,6 @@ class HealthCheckView(View):
     config_path = None
     environment = None
 
-    @method_decorator(never_cache)
-    def dispatch(self, request, *args, **kwargs):
-        return super().dispatch(request, *args, **kwargs)
-
     def get(self, request: HttpRequest) -> HttpResponse:
         return healthcheck_view(
             request,
@@ -70,7 +105,6 @@ class HealthCheckView(View):
         )
 
 
-@never_cache
 def healthcheck_view(
     request: HttpRequest,
     app_name: str = "Django Application",
@@ -80,8 +114,12 @@ def healthcheck_view(
     """
     Django function-based view for health checks.
 
-    Returns HTML or JSON based on Accept header or ?format parameter.
+    Returns HTML or JSON based on Accept header, ?format parameter or a
+    .json URL suffix.
     HTTP status codes: 200 OK if all pass, 503 Service Unavailable if any fail.
+    Passing responses built only from rate-limit cached results include an
+    ETag; a matching If-None-Match gets a 304 Not Modified without
+    rendering the page.
 
     Args:
         request: Django HTTP request
@@ -105,51 +143,71 @@ def healthcheck_view(
     # Determine response format
     wants_json = (
         'application/json' in request.headers.get('Accept', '') or
-        request.GET.get('format') == 'json'
+        request.GET.get('format') == 'json' or
+        request.path.endswith('.json')
     )
 
     # Determine HTTP status code
     status_code = 200 if overall_status == "passed" else 503
 
-    if wants_json:
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Responses built only from cached results carry an ETag so repeat
+    # clients can get a 304
+    not_modified = None
+    etag = compute_etag(results, overall_status, app_name, environment, timestamp, wants_json)
+    if etag is not None:
+        not_modified = get_conditional_response(request, etag=etag)
+
+    if not_modified is not None:
+        # Client already has this result, skip rendering
+        response = not_modified
+    elif wants_json:
         # Return JSON response
         response = JsonResponse(
-            _format_json_response(results, stats, overall_status, app_name, environment),
+            _format_json_response(results, stats, overall_status, app_name, environment, timestamp),
             status=status_code
         )
     else:
         # Return HTML response
-        # Add formatted duration for template compatibility
-        formatted_results = []
-        for check, result in results:
-            # Create a copy of result with formatted duration
-            result_dict = {
-                'status': result.status,
-                'message': result.message,
-                'error': result.error,
-                'duration_ms': result.duration_ms,
-                'duration_formatted': f"{result.duration_ms:.1f}" if result.duration_ms is not None else None,
-                'skip_reason': result.skip_reason,
-            }
-            formatted_results.append((check, type('Result', (), result_dict)()))
-
         context = {
-            'results': formatted_results,
+            'results': _format_html_results(results),
             'stats': stats,
             'overall_status': overall_status,
             'app_name': app_name,
             'environment': environment,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'timestamp': timestamp,
         }
 
         html_content = _render_html_template(context)
         response = HttpResponse(html_content, status=status_code, content_type='text/html')
 
-    # Add Cache-Control headers to prevent caching
-    response['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
+    if etag is not None:
+        response['ETag'] = etag
+        response['Cache-Control'] = REVALIDATE_CACHE_CONTROL
+    else:
+        # Add Cache-Control headers to prevent caching
+        response['Cache-Control'] = NO_STORE_CACHE_CONTROL
     return response
 
 
+def _format_html_results(results):
+    """Add formatted durations to results for template compatibility."""
+    formatted_results = []
+    for check, result in results:
+        # Create a copy of result with formatted duration
+        result_dict = {
+            'status': result.status,
+            'message': result.message,
+            'error': result.error,
+            'duration_ms': result.duration_ms,
+            'duration_formatted': f"{result.duration_ms:.1f}" if result.duration_ms is not None else None,
+            'skip_reason': result.skip_reason,
+        }
+        formatted_results.append((check, type('Result', (), result_dict)()))
+    return formatted_results
+
+
 def _calculate_stats(results):
     """Calculate statistics from check results."""
     stats = {
@@ -188,7 +246,7 @@ def _get_overall_status(stats):
         return "unknown"
 
 
-def _format_json_response(results, stats, overall_status, app_name, environment):
+def _format_json_response(results, stats, overall_status, app_name, environment, timestamp):
     """Format results for JSON response."""
     json_results = []
     for check, result in results:
@@ -206,15 +264,51 @@ def _format_json_response(results, stats, overall_status, app_name, environment)
         "stats": stats,
         "environment": environment,
         "app_name": app_name,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": timestamp,
         "checks": json_results,
     }
 
 
+def _get_jinja2_engine():
+    """Return the first configured Jinja2 template engine, if any."""
+    try:
+        from django.template.backends.jinja2 import Jinja2
+    except ImportError:
+        return None
+
+    for engine in engines.all():
+        if isinstance(engine, Jinja2):
+            return engine
+    return None
+
+
+def _get_healthcheck_template():
+    """Resolve the health check template once, honouring project overrides."""
+    global _healthcheck_template
+    if _healthcheck_template is None:
+        jinja2_engine = None
+        if getattr(settings, 'ALLGREEN_USE_JINJA2', False):
+            jinja2_engine = _get_jinja2_engine()
+
+        if jinja2_engine is not None:
+            try:
+                _healthcheck_template = jinja2_engine.get_template('allgreen/healthcheck.html')
+            except TemplateDoesNotExist:
+                # No project override: use the bundled Jinja2 template
+                with open(_JINJA2_TEMPLATE_PATH, encoding='utf-8') as f:
+                    _healthcheck_template = jinja2_engine.from_string(f.read())
+        else:
+            _healthcheck_template = get_template('allgreen/healthcheck.html')
+    return _healthcheck_template
+
+
 def _render_html_template(context):
     """
-    Render HTML template using Django's template system.
+    Render HTML template using Django's configured template engines.
 
-    Uses the shared template at allgreen/healthcheck.html.
+    Uses a Jinja2 backend when ALLGREEN_USE_JINJA2 is set and one is
+    configured, and allgreen/healthcheck.html via the normal template
+    lookup otherwise. The template is looked up once and reused for
+    subsequent requests.
     """
-    return render_to_string('allgreen/healthcheck.html', context)
+    return _get_healthcheck_template().render(context)
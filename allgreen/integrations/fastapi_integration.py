@@ -25,7 +25,7 @@ from datetime import datetime
 try:
     import anyio
     from fastapi import APIRouter, Request
-    from fastapi.responses import HTMLResponse, JSONResponse
+    from fastapi.responses import HTMLResponse, JSONResponse, Response
     from jinja2 import Environment, FileSystemLoader
 except ImportError:
     raise ImportError(
@@ -37,6 +37,12 @@ import allgreen
 
 from ..config import load_config
 from ..core import CheckStatus, get_registry
+from .caching import (
+    NO_STORE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    compute_etag,
+    etag_matches,
+)
 
 
 def create_router(
@@ -129,12 +135,23 @@ async def _healthcheck_handler(
     status_code = 200 if overall_status == "passed" else 503
 
     # Cache-Control headers to prevent caching
-    headers = {"Cache-Control": "no-store, no-cache, must-revalidate, max-age=0"}
+    headers = {"Cache-Control": NO_STORE_CACHE_CONTROL}
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+    # Responses built only from cached results carry an ETag so repeat
+    # clients can get a 304
+    etag = compute_etag(results, overall_status, app_name, environment, timestamp, wants_json)
+    if etag is not None:
+        headers["ETag"] = etag
+        headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+        if request and etag_matches(request.headers.get("if-none-match"), etag):
+            # Client already has this result, skip rendering
+            return Response(status_code=304, headers=headers)
 
     if wants_json:
         # Return JSON response
         response_data = _format_json_response(
-            results, stats, overall_status, app_name, environment
+            results, stats, overall_status, app_name, environment, timestamp
         )
         return JSONResponse(content=response_data, status_code=status_code, headers=headers)
     else:
@@ -145,7 +162,7 @@ async def _healthcheck_handler(
             'overall_status': overall_status,
             'app_name': app_name,
             'environment': environment,
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'timestamp': timestamp,
         }
 
         html_content = _render_html_template(context)
@@ -190,7 +207,7 @@ def _get_overall_status(stats):
         return "unknown"
 
 
-def _format_json_response(results, stats, overall_status, app_name, environment):
+def _format_json_response(results, stats, overall_status, app_name, environment, timestamp):
     """Format results for JSON response."""
     json_results = []
     for check, result in results:
@@ -208,7 +225,7 @@ def _format_json_response(results, stats, overall_status, app_name, environment)
         "stats": stats,
         "environment": environment,
         "app_name": app_name,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "timestamp": timestamp,
         "checks": json_results,
     }
 
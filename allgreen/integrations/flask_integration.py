@@ -8,6 +8,12 @@ import allgreen
 
 from ..config import load_config
 from ..core import Check, CheckResult, CheckStatus, get_registry
+from .caching import (
+    NO_STORE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    compute_etag,
+    etag_matches,
+)
 
 
 class HealthCheckApp:
@@ -104,9 +110,14 @@ class HealthCheckApp:
 
         return results, metadata
 
-    def healthcheck_html(self) -> tuple[str, int, dict[str, str]]:
-        """Generate HTML health check page."""
-        results, metadata = self.run_health_checks()
+    def healthcheck_html(
+        self,
+        results: list[tuple[Check, CheckResult]] | None = None,
+        metadata: dict[str, Any] | None = None
+    ) -> tuple[str, int, dict[str, str]]:
+        """Generate HTML health check page, running checks unless results are given."""
+        if results is None or metadata is None:
+            results, metadata = self.run_health_checks()
 
         # Determine HTTP status code
         status_code = 200 if metadata["overall_status"] == "passed" else 503
@@ -119,13 +130,18 @@ class HealthCheckApp:
         )
 
         # Add Cache-Control headers
-        headers = {"Cache-Control": "no-store, no-cache, must-revalidate, max-age=0"}
+        headers = {"Cache-Control": NO_STORE_CACHE_CONTROL}
 
         return html, status_code, headers
 
-    def healthcheck_json(self) -> tuple[dict[str, Any], int, dict[str, str]]:
-        """Generate JSON health check response."""
-        results, metadata = self.run_health_checks()
+    def healthcheck_json(
+        self,
+        results: list[tuple[Check, CheckResult]] | None = None,
+        metadata: dict[str, Any] | None = None
+    ) -> tuple[dict[str, Any], int, dict[str, str]]:
+        """Generate JSON health check response, running checks unless results are given."""
+        if results is None or metadata is None:
+            results, metadata = self.run_health_checks()
 
         # Convert results to JSON-serializable format
         json_results = []
@@ -152,7 +168,7 @@ class HealthCheckApp:
         status_code = 200 if metadata["overall_status"] == "passed" else 503
 
         # Add Cache-Control headers
-        headers = {"Cache-Control": "no-store, no-cache, must-revalidate, max-age=0"}
+        headers = {"Cache-Control": NO_STORE_CACHE_CONTROL}
 
         return response_data, status_code, headers
 
@@ -182,30 +198,51 @@ def create_healthcheck_blueprint(
         auto_reload_config=auto_reload_config
     )
 
-    @blueprint.route("/healthcheck")
-    def healthcheck():
-        """Health check endpoint that returns HTML by default, JSON if requested."""
-        accept_header = request.headers.get("Accept", "")
-        if "application/json" in accept_header or request.args.get("format") == "json":
-            data, status_code, headers = health_checker.healthcheck_json()
+    def healthcheck_response(wants_json: bool) -> Response:
+        """Run checks and build the response, or a 304 if the client is current."""
+        results, metadata = health_checker.run_health_checks()
+
+        # Responses built only from cached results carry an ETag so repeat
+        # clients can get a 304
+        etag = compute_etag(
+            results,
+            metadata["overall_status"],
+            metadata["app_name"],
+            metadata["environment"],
+            metadata["timestamp"],
+            wants_json,
+        )
+        if etag is not None and etag_matches(request.headers.get("If-None-Match"), etag):
+            # Client already has this result, skip rendering
+            response = Response(status=304)
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+            response.headers["ETag"] = etag
+            return response
+
+        if wants_json:
+            data, status_code, headers = health_checker.healthcheck_json(results, metadata)
             response = jsonify(data)
             response.status_code = status_code
-            response.headers.update(headers)
-            return response
         else:
-            html, status_code, headers = health_checker.healthcheck_html()
+            html, status_code, headers = health_checker.healthcheck_html(results, metadata)
             response = Response(html, status=status_code, mimetype="text/html")
-            response.headers.update(headers)
-            return response
+        response.headers.update(headers)
+        if etag is not None:
+            response.headers["Cache-Control"] = REVALIDATE_CACHE_CONTROL
+            response.headers["ETag"] = etag
+        return response
+
+    @blueprint.route("/healthcheck")
+    def healthcheck():
+        """Health check endpoint that returns HTML by default, JSON if requested."""
+        accept_header = request.headers.get("Accept", "")
+        wants_json = "application/json" in accept_header or request.args.get("format") == "json"
+        return healthcheck_response(wants_json)
 
     @blueprint.route("/healthcheck.json")
     def healthcheck_json():
         """Explicit JSON health check endpoint."""
-        data, status_code, headers = health_checker.healthcheck_json()
-        response = jsonify(data)
-        response.status_code = status_code
-        response.headers.update(headers)
-        return response
+        return healthcheck_response(wants_json=True)
 
     return blueprint
 
@@ -7,6 +7,7 @@ Supports patterns like:
 - "1 time per minute"
 """
 
+import os
 import pickle
 import re
 import threading
@@ -15,6 +16,10 @@ from pathlib import Path
 
 DEFAULT_CACHE_DIR = Path.home() / ".allgreen" / "rate_limits"
 
+# Separates the environment from the check description in check IDs,
+# e.g. "production::Database is reachable"
+ENVIRONMENT_SEPARATOR = "::"
+
 
 class RateLimitConfig:
     """Configuration for a rate-limited check."""
@@ -74,35 +79,106 @@ class RateLimitTracker:
         self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        # Plain string paths keep the per-check I/O path free of Path objects
+        self._cache_dir = os.fspath(self.cache_dir)
+        self._cache_subdirs: set[str] = {self._cache_dir}
+        # check_id -> cache file path, computed once per check
+        self._cache_paths: dict[str, str] = {}
+        # check_id -> (cache file signature, state). The signature lets us skip
+        # re-reading a file that no other process has touched since.
+        self._states: dict[str, tuple[tuple[int, int, int] | None, dict]] = {}
 
     def _get_cache_file(self, check_id: str) -> Path:
         """Get the cache file path for a specific check."""
-        # Use check description as ID, but sanitize for filesystem
-        safe_id = re.sub(r'[^\w\-_.]', '_', check_id)
-        return self.cache_dir / f"{safe_id}.pkl"
+        return Path(self._get_cache_path(check_id))
 
-    def _load_state(self, check_id: str) -> dict:
-        """Load the rate limit state from disk."""
-        cache_file = self._get_cache_file(check_id)
-        if not cache_file.exists():
-            return {"count": 0, "period_start": None, "last_result": None}
+    def _get_cache_path(self, check_id: str) -> str:
+        """
+        Get the cache file path for a specific check as a string.
 
+        Namespaced check IDs ("env::description") are stored in a
+        per-environment subdirectory, so each environment's state is
+        kept apart on disk.
+        """
+        path = self._cache_paths.get(check_id)
+        if path is None:
+            environment, separator, name = check_id.partition(ENVIRONMENT_SEPARATOR)
+            if not separator:
+                path = os.path.join(self._cache_dir, f"{self._sanitize(check_id)}.pkl")
+            else:
+                path = os.path.join(
+                    self._cache_dir, self._sanitize(environment), f"{self._sanitize(name)}.pkl"
+                )
+            self._cache_paths[check_id] = path
+        return path
+
+    def _sanitize(self, value: str) -> str:
+        """Make a check ID component safe to use as a file name."""
+        safe = re.sub(r'[^\w\-_.]', '_', value)
+        # Never produce "", "." or ".." which would resolve outside the shard
+        return safe if safe.strip(".") else f"_{safe}"
+
+    def _get_file_signature(self, cache_path: str) -> tuple[int, int, int] | None:
+        """Return (inode, mtime_ns, size) of a cache file, or None if missing."""
         try:
-            with open(cache_file, "rb") as f:
-                return pickle.load(f)
-        except (OSError, pickle.PickleError):
-            # If cache is corrupted, start fresh
-            return {"count": 0, "period_start": None, "last_result": None}
+            stat = os.stat(cache_path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _load_state(self, check_id: str) -> dict:
+        """Load the rate limit state, reading from disk only if it changed."""
+        cache_path = self._get_cache_path(check_id)
+        signature = self._get_file_signature(cache_path)
+
+        cached = self._states.get(check_id)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        if signature is None:
+            state = {"count": 0, "period_start": None, "last_result": None}
+        else:
+            try:
+                # One-shot read of a small file: skip the BufferedReader layer
+                with open(cache_path, "rb", buffering=0) as f:
+                    state = pickle.loads(f.read())
+            except (OSError, pickle.PickleError):
+                # If cache is corrupted, start fresh
+                state = {"count": 0, "period_start": None, "last_result": None}
+
+        self._states[check_id] = (signature, state)
+        return state
 
     def _save_state(self, check_id: str, state: dict) -> None:
-        """Save the rate limit state to disk."""
-        cache_file = self._get_cache_file(check_id)
+        """Save the rate limit state to memory and disk."""
+        cache_path = self._get_cache_path(check_id)
+        signature = None
         try:
-            with open(cache_file, "wb") as f:
-                pickle.dump(state, f)
+            cache_subdir = os.path.dirname(cache_path)
+            if cache_subdir not in self._cache_subdirs:
+                os.makedirs(cache_subdir, exist_ok=True)
+                self._cache_subdirs.add(cache_subdir)
+
+            # Write to a temporary file and rename it into place so other
+            # processes never read a partially written cache file
+            data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            try:
+                # Buffered write() keeps writing until all of data is out
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
+            signature = self._get_file_signature(cache_path)
         except OSError:
-            # If we can't save to cache, continue without persistence
+            # If we can't save to cache, continue with in-memory state only
             pass
+        self._states[check_id] = (signature, state)
 
     def should_run_check(
         self, check_id: str, config: RateLimitConfig, now: datetime | None = None
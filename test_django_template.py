@@ -10,31 +10,67 @@ if not settings.configured:
         TEMPLATES=[{
             'BACKEND': 'django.template.backends.django.DjangoTemplates',
             'DIRS': [],
-            'APP_DIRS': True,
+            'OPTIONS': {
+                # Keep compiled templates in memory between renders
+                'loaders': [
+                    ('django.template.loaders.cached.Loader', [
+                        'django.template.loaders.filesystem.Loader',
+                        'django.template.loaders.app_directories.Loader',
+                    ]),
+                ],
+            },
+        }, {
+            'BACKEND': 'django.template.backends.jinja2.Jinja2',
+            'DIRS': [],
             'OPTIONS': {},
         }],
         INSTALLED_APPS=[
             'allgreen',  # Add allgreen as an app
-        ]
+        ],
+        ALLGREEN_USE_JINJA2=True,
     )
     django.setup()
 
+CONTEXT = {
+    'results': [],
+    'stats': {'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0},
+    'overall_status': 'passed',
+    'app_name': 'Test App',
+    'environment': 'test',
+    'timestamp': '2024-01-01 12:00:00',
+}
+
+
+
+def _results_context():
+    """Build a context covering every result status the template renders."""
+    from allgreen.core import Check, CheckResult, CheckStatus
+    from allgreen.integrations.django_integration import _format_html_results
+
+    def noop():
+        pass
+
+    results = [
+        (Check("Database is reachable", noop), CheckResult(CheckStatus.PASSED, duration_ms=12.34)),
+        (Check("Disk has free space", noop), CheckResult(CheckStatus.FAILED, message="Only 2% free", duration_ms=3.21)),
+        (Check("Cache responds", noop), CheckResult(CheckStatus.ERROR, message="Connection refused", error="Connection refused")),
+        (Check("Only in production", noop), CheckResult(CheckStatus.SKIPPED, skip_reason="Skipped in test environment")),
+    ]
+    return {
+        **CONTEXT,
+        'results': _format_html_results(results),
+        'stats': {'total': 4, 'passed': 1, 'failed': 2, 'skipped': 1},
+        'overall_status': 'failed',
+    }
+
+
 def test_template_discovery():
     """Test that Django can find the allgreen template."""
     try:
         from django.template.loader import render_to_string
 
-        context = {
-            'results': [],
-            'stats': {'total': 0, 'passed': 0, 'failed': 0, 'skipped': 0},
-            'overall_status': 'passed',
-            'app_name': 'Test App',
-            'environment': 'test',
-            'timestamp': '2024-01-01 12:00:00',
-        }
-
         # This should find allgreen/templates/allgreen/healthcheck.html
-        html = render_to_string('allgreen/healthcheck.html', context)
+        html = render_to_string('allgreen/healthcheck.html', CONTEXT, using='django')
 
         if html and '<!DOCTYPE html>' in html:
             print("✅ Django template discovery working!")
@@ -48,6 +84,29 @@ def test_template_discovery():
         print(f"❌ Django template discovery failed: {e}")
         return False
 
+
+def test_jinja2_rendering():
+    """Test that the integration renders through Jinja2 when it is configured."""
+    try:
+        from django.template.loader import render_to_string
+
+        from allgreen.integrations.django_integration import _render_html_template
+
+        for context in (CONTEXT, _results_context()):
+            html = _render_html_template(context)
+            django_html = render_to_string('allgreen/healthcheck.html', context, using='django')
+
+            if html != django_html:
+                print("❌ Jinja2 rendering differs from Django templates")
+                return False
+
+        print("✅ Jinja2 rendering matches Django templates!")
+        return True
+
+    except Exception as e:
+        print(f"❌ Jinja2 rendering failed: {e}")
+        return False
+
 if __name__ == "__main__":
-    success = test_template_discovery()
+    success = test_template_discovery() and test_jinja2_rendering()
     exit(0 if success else 1)
@@ -101,3 +101,41 @@ def env_check():
 
     finally:
         os.unlink(config_path)
+
+
+def test_load_config_skips_unchanged_file():
+    registry = get_registry()
+    registry.clear()
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+@check("Cached config check")
+def cached_check():
+    make_sure(True)
+''')
+        config_path = f.name
+
+    try:
+        assert load_config(config_path)
+        first_checks = registry.get_checks()
+
+        # Unchanged config is not executed again
+        assert load_config(config_path)
+        assert registry.get_checks() == first_checks
+
+        # Clearing the registry forces a reload
+        registry.clear()
+        assert load_config(config_path)
+        reloaded_checks = registry.get_checks()
+        assert len(reloaded_checks) == 1
+        assert reloaded_checks[0] is not first_checks[0]
+
+        # So does modifying the file
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert load_config(config_path)
+        assert len(registry.get_checks()) == 1
+        assert registry.get_checks()[0] is not reloaded_checks[0]
+
+    finally:
+        os.unlink(config_path)
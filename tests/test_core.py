@@ -1,3 +1,8 @@
+import asyncio
+import subprocess
+import sys
+import time
+
 import pytest
 
 from allgreen import (
@@ -121,3 +126,102 @@ def test_if_condition():
     assert true_result.passed
     assert false_result.skipped
     assert "Custom condition is False" in false_result.skip_reason
+
+
+def test_run_all_runs_checks_concurrently():
+    registry = get_registry()
+    registry.clear()
+
+    @check("First slow check")
+    def first_slow_check():
+        time.sleep(0.5)
+        make_sure(True)
+
+    @check("Second slow check")
+    def second_slow_check():
+        time.sleep(0.5)
+        make_sure(False, "Second check fails")
+
+    start_time = time.time()
+    results = registry.run_all()
+    elapsed = time.time() - start_time
+
+    # Results keep registration order
+    assert [c.description for c, _ in results] == ["First slow check", "Second slow check"]
+    assert results[0][1].passed
+    assert results[1][1].failed
+    assert elapsed < 0.9
+
+
+def test_run_all_async_runs_checks_concurrently():
+    registry = get_registry()
+    registry.clear()
+
+    @check("First slow async check")
+    def first_slow_check():
+        time.sleep(0.5)
+        make_sure(True)
+
+    @check("Second slow async check")
+    def second_slow_check():
+        time.sleep(0.5)
+        make_sure(True)
+
+    start_time = time.time()
+    results = asyncio.run(registry.run_all_async())
+    elapsed = time.time() - start_time
+
+    assert [c.description for c, _ in results] == ["First slow async check", "Second slow async check"]
+    assert all(result.passed for _, result in results)
+    assert elapsed < 0.9
+
+
+def test_import_does_not_load_web_frameworks():
+    code = (
+        "import sys, allgreen; "
+        "print(any(m in sys.modules for m in ('flask', 'django', 'fastapi')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "False"
+
+
+def test_check_status_compares_to_string():
+    registry = get_registry()
+    registry.clear()
+
+    @check("String status check")
+    def string_status_check():
+        make_sure(True)
+
+    result = registry.get_checks()[0].execute()
+
+    assert result.status == "passed"
+    assert CheckStatus("failed") == "failed"
+
+
+def test_run_all_with_more_checks_than_pool_workers():
+    from allgreen.core import _POOL_SIZE
+
+    registry = get_registry()
+    registry.clear()
+    check_count = _POOL_SIZE + 3
+
+    for i in range(check_count):
+        @check(f"Slow check {i}", timeout=1)
+        def slow_check():
+            time.sleep(0.5)
+            make_sure(True)
+
+    original_concurrency = registry.max_concurrency
+    registry.max_concurrency = check_count
+    try:
+        # Checks beyond the pool size must not time out while waiting for a worker
+        results = registry.run_all()
+        assert all(result.passed for _, result in results), results
+
+        results = asyncio.run(registry.run_all_async())
+        assert all(result.passed for _, result in results), results
+    finally:
+        registry.max_concurrency = original_concurrency
@@ -0,0 +1,105 @@
+import os
+import tempfile
+
+import pytest
+
+django = pytest.importorskip("django")
+
+from django.conf import settings  # noqa: E402
+
+if not settings.configured:
+    settings.configure(
+        TEMPLATES=[{
+            'BACKEND': 'django.template.backends.django.DjangoTemplates',
+            'DIRS': [],
+            'APP_DIRS': True,
+            'OPTIONS': {},
+        }],
+        INSTALLED_APPS=['allgreen'],
+    )
+    django.setup()
+
+from django.test import RequestFactory  # noqa: E402
+
+from allgreen import get_registry  # noqa: E402
+from allgreen.integrations.django_integration import healthcheck_view  # noqa: E402
+from allgreen.rate_limiting import RateLimitTracker  # noqa: E402
+
+
+def _write_config(source):
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write(source)
+        return f.name
+
+
+def test_healthcheck_etag_not_modified(tmp_path, monkeypatch):
+    monkeypatch.setattr("allgreen.rate_limiting._rate_tracker", RateLimitTracker(tmp_path))
+    registry = get_registry()
+    registry.clear()
+
+    config_path = _write_config('''
+@check("Django ETag check", run="1 time per hour")
+def etag_check():
+    make_sure(True)
+''')
+
+    try:
+        factory = RequestFactory()
+
+        # A check that just ran has a fresh duration, so nothing to revalidate
+        response = healthcheck_view(factory.get('/healthcheck.json'), config_path=config_path)
+        assert response.status_code == 200
+        assert not response.has_header('ETag')
+        assert 'no-store' in response['Cache-Control']
+
+        # Served from the rate limit cache; retry across a second boundary
+        for _ in range(5):
+            response = healthcheck_view(factory.get('/healthcheck.json'), config_path=config_path)
+            assert response.status_code == 200
+            etag = response['ETag']
+            assert 'no-store' not in response['Cache-Control']
+            assert 'no-cache' in response['Cache-Control']
+
+            response = healthcheck_view(
+                factory.get('/healthcheck.json', HTTP_IF_NONE_MATCH=etag),
+                config_path=config_path
+            )
+            if response.status_code == 304:
+                break
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response['ETag'] == etag
+        assert 'no-store' not in response['Cache-Control']
+
+        # The HTML representation has its own ETag
+        response = healthcheck_view(
+            factory.get('/healthcheck/', HTTP_IF_NONE_MATCH=etag),
+            config_path=config_path
+        )
+        assert response.status_code == 200
+        assert b'Django ETag check' in response.content
+
+    finally:
+        os.unlink(config_path)
+
+
+def test_failing_healthcheck_not_stored():
+    registry = get_registry()
+    registry.clear()
+
+    config_path = _write_config('''
+@check("Django failing check")
+def failing_check():
+    make_sure(False)
+''')
+
+    try:
+        response = healthcheck_view(
+            RequestFactory().get('/healthcheck.json'), config_path=config_path
+        )
+        assert response.status_code == 503
+        assert not response.has_header('ETag')
+        assert 'no-store' in response['Cache-Control']
+
+    finally:
+        os.unlink(config_path)
@@ -0,0 +1,87 @@
+import os
+import tempfile
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from allgreen import get_registry  # noqa: E402
+from allgreen.integrations.fastapi_integration import create_router  # noqa: E402
+from allgreen.rate_limiting import RateLimitTracker  # noqa: E402
+
+
+def _create_client(source):
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write(source)
+        config_path = f.name
+
+    app = FastAPI()
+    app.include_router(create_router(config_path=config_path))
+    return TestClient(app), config_path
+
+
+def test_healthcheck_etag_not_modified(tmp_path, monkeypatch):
+    monkeypatch.setattr("allgreen.rate_limiting._rate_tracker", RateLimitTracker(tmp_path))
+    registry = get_registry()
+    registry.clear()
+
+    client, config_path = _create_client('''
+@check("FastAPI ETag check", run="1 time per hour")
+def etag_check():
+    make_sure(True)
+''')
+
+    try:
+        # A check that just ran has a fresh duration, so nothing to revalidate
+        response = client.get('/healthcheck.json')
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+        assert 'no-store' in response.headers['Cache-Control']
+
+        # Served from the rate limit cache; retry across a second boundary
+        for _ in range(5):
+            response = client.get('/healthcheck.json')
+            assert response.status_code == 200
+            etag = response.headers['ETag']
+            assert 'no-store' not in response.headers['Cache-Control']
+            assert 'no-cache' in response.headers['Cache-Control']
+
+            response = client.get('/healthcheck.json', headers={'If-None-Match': etag})
+            if response.status_code == 304:
+                break
+        assert response.status_code == 304
+        assert response.content == b''
+        assert response.headers['ETag'] == etag
+        assert 'no-store' not in response.headers['Cache-Control']
+
+        # The HTML representation has its own ETag
+        response = client.get('/healthcheck', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert 'FastAPI ETag check' in response.text
+
+    finally:
+        os.unlink(config_path)
+
+
+def test_failing_healthcheck_not_stored():
+    registry = get_registry()
+    registry.clear()
+
+    client, config_path = _create_client('''
+@check("FastAPI failing check")
+def failing_check():
+    make_sure(False)
+''')
+
+    try:
+        response = client.get('/healthcheck.json')
+        assert response.status_code == 503
+        assert 'ETag' not in response.headers
+        assert 'no-store' in response.headers['Cache-Control']
+
+    finally:
+        os.unlink(config_path)
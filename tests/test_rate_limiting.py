@@ -184,3 +184,70 @@ class TestRateLimitTracker:
             # Should handle corruption gracefully
             should_run, _, _ = tracker.should_run_check(check_id, config)
             assert should_run is True  # Should start fresh
+
+    def test_state_served_from_memory(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tracker = RateLimitTracker(Path(tmpdir))
+            config = RateLimitConfig("1 time per hour")
+            check_id = "memory_test"
+
+            should_run, _, _ = tracker.should_run_check(check_id, config)
+            assert should_run is True
+
+            # Unchanged cache files should not be read again
+            def fail_load(data):
+                raise AssertionError("cache file was re-read")
+
+            monkeypatch.setattr("allgreen.rate_limiting.pickle.loads", fail_load)
+            should_run, skip_reason, _ = tracker.should_run_check(check_id, config)
+            assert should_run is False
+            assert "Rate limited" in skip_reason
+
+    def test_picks_up_changes_from_other_trackers(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            config = RateLimitConfig("2 times per hour")
+            check_id = "shared_test"
+
+            tracker1 = RateLimitTracker(cache_dir)
+            tracker2 = RateLimitTracker(cache_dir)
+
+            tracker1.should_run_check(check_id, config)
+            tracker2.should_run_check(check_id, config)
+
+            # tracker1 must see the run recorded by tracker2
+            should_run, skip_reason, _ = tracker1.should_run_check(check_id, config)
+            assert should_run is False
+            assert "2/2 runs used" in skip_reason
+
+    def test_environments_sharded_on_disk(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            tracker = RateLimitTracker(cache_dir)
+            config = RateLimitConfig("1 time per hour")
+
+            tracker.should_run_check("production::Shared check", config)
+            should_run, _, _ = tracker.should_run_check("staging::Shared check", config)
+            assert should_run is True  # Environments are limited independently
+
+            assert (cache_dir / "production" / "Shared_check.pkl").exists()
+            assert (cache_dir / "staging" / "Shared_check.pkl").exists()
+
+    def test_failed_save_leaves_no_temp_files(self, monkeypatch):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_dir = Path(tmpdir)
+            tracker = RateLimitTracker(cache_dir)
+            config = RateLimitConfig("1 time per hour")
+
+            def fail_replace(src, dst):
+                raise OSError("disk full")
+
+            monkeypatch.setattr("allgreen.rate_limiting.os.replace", fail_replace)
+            should_run, _, _ = tracker.should_run_check("failing_save", config)
+            assert should_run is True  # Falls back to in-memory state
+
+            assert list(cache_dir.iterdir()) == []
+
+            # The in-memory state still enforces the limit
+            should_run, _, _ = tracker.should_run_check("failing_save", config)
+            assert should_run is False
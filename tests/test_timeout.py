@@ -1,3 +1,6 @@
+import asyncio
+import contextvars
+import threading
 import time
 
 import pytest
@@ -164,3 +167,86 @@ class TestTimeoutFunctionality:
         check_obj = registry.get_checks()[0]
         # Zero timeout should be converted to default
         assert check_obj.timeout == 10  # Default timeout
+
+    def test_async_check_timeout_error(self):
+        """Test that async execution enforces the timeout without blocking."""
+        registry = get_registry()
+        registry.clear()
+
+        @check("Slow async check with timeout", timeout=1)
+        def slow_async_check():
+            time.sleep(1.5)
+            make_sure(True, "Should not reach this")
+
+        check_obj = registry.get_checks()[0]
+        result = asyncio.run(check_obj.execute_async())
+
+        assert result.status == CheckStatus.ERROR
+        assert "timed out after 1 seconds" in result.error
+        assert result.message == "Check timed out"
+
+    def test_timeout_outside_main_thread(self):
+        """Test that timeouts are enforced when checks run off the main thread."""
+        registry = get_registry()
+        registry.clear()
+
+        @check("Slow check in worker thread", timeout=1)
+        def slow_thread_check():
+            time.sleep(2)
+            make_sure(True, "Should not reach this")
+
+        check_obj = registry.get_checks()[0]
+        results = []
+        start_time = time.time()
+        worker = threading.Thread(target=lambda: results.append(check_obj.execute()))
+        worker.start()
+        worker.join()
+        end_time = time.time()
+
+        assert results[0].status == CheckStatus.ERROR
+        assert "timed out after 1 seconds" in results[0].error
+        assert (end_time - start_time) < 2.0
+
+    def test_hung_checks_do_not_exhaust_worker_pool(self):
+        """Test that abandoned hung checks don't make later checks time out."""
+        from allgreen.core import _POOL_SIZE, Check
+
+        release = threading.Event()
+        try:
+            # Occupy every pool worker with a check that never returns in time
+            for _ in range(_POOL_SIZE):
+                hung = Check("Hung check", release.wait, timeout=0.1)
+                assert hung.execute().status == CheckStatus.ERROR
+
+            fast = Check("Fast check", lambda: None, timeout=1)
+            result = fast.execute()
+            assert result.status == CheckStatus.PASSED
+
+            result = asyncio.run(fast.execute_async())
+            assert result.status == CheckStatus.PASSED
+        finally:
+            release.set()
+
+    def test_checks_see_caller_context_variables(self):
+        """Test that checks run with the caller's context variables."""
+        from allgreen.core import _POOL_SIZE, Check
+
+        request_id = contextvars.ContextVar("request_id", default=None)
+
+        def reads_context():
+            make_sure(request_id.get() == "abc123", "Context variable not visible")
+
+        context_check = Check("Context check", reads_context, timeout=1)
+        token = request_id.set("abc123")
+        release = threading.Event()
+        try:
+            assert context_check.execute().status == CheckStatus.PASSED
+            assert asyncio.run(context_check.execute_async()).status == CheckStatus.PASSED
+
+            # Same when the pool is saturated and checks get their own thread
+            for _ in range(_POOL_SIZE):
+                Check("Hung check", release.wait, timeout=0.1).execute()
+            assert context_check.execute().status == CheckStatus.PASSED
+        finally:
+            release.set()
+            request_id.reset(token)
@@ -1,8 +1,9 @@
 import os
 import tempfile
 
-from allgreen import get_registry
+from allgreen import check, get_registry, make_sure
 from allgreen.integrations.flask_integration import create_app
+from allgreen.rate_limiting import RateLimitTracker
 
 
 def test_healthcheck_html_endpoint():
@@ -177,3 +178,107 @@ def skip_check():
 
     finally:
         os.unlink(config_path)
+
+
+def test_lazy_package_exports():
+    import allgreen
+
+    assert allgreen.create_app is create_app
+    assert "create_app" in dir(allgreen)
+    assert "create_app" in allgreen.__all__
+
+
+def test_healthcheck_etag_not_modified(tmp_path, monkeypatch):
+    monkeypatch.setattr("allgreen.rate_limiting._rate_tracker", RateLimitTracker(tmp_path))
+    registry = get_registry()
+    registry.clear()
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+@check("ETag test check", run="1 time per hour")
+def etag_check():
+    make_sure(True)
+''')
+        config_path = f.name
+
+    try:
+        app = create_app(config_path=config_path, auto_reload_config=False)
+        client = app.test_client()
+
+        # A check that just ran has a fresh duration, so nothing to revalidate
+        response = client.get('/healthcheck.json')
+        assert response.status_code == 200
+        assert 'ETag' not in response.headers
+        assert 'no-store' in response.headers['Cache-Control']
+
+        # Served from the rate limit cache, so the page can be revalidated.
+        # The timestamp is part of the ETag, so retry across a second boundary.
+        for _ in range(5):
+            response = client.get('/healthcheck.json')
+            assert response.status_code == 200
+            etag = response.headers['ETag']
+            # Cacheable so clients can revalidate, but never without asking
+            assert 'no-store' not in response.headers['Cache-Control']
+            assert 'no-cache' in response.headers['Cache-Control']
+
+            response = client.get('/healthcheck.json', headers={'If-None-Match': etag})
+            if response.status_code == 304:
+                break
+        assert response.status_code == 304
+        assert response.data == b''
+        assert response.headers['ETag'] == etag
+        assert 'no-store' not in response.headers['Cache-Control']
+
+        # The HTML representation has its own ETag
+        response = client.get('/healthcheck', headers={'If-None-Match': etag})
+        assert response.status_code == 200
+        assert b'ETag test check' in response.data
+
+    finally:
+        os.unlink(config_path)
+
+
+def test_failing_healthcheck_not_stored():
+    registry = get_registry()
+    registry.clear()
+
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as f:
+        f.write('''
+@check("Failing ETag check")
+def failing_check():
+    make_sure(False)
+''')
+        config_path = f.name
+
+    try:
+        app = create_app(config_path=config_path, auto_reload_config=False)
+        client = app.test_client()
+
+        response = client.get('/healthcheck.json')
+        assert response.status_code == 503
+        assert 'ETag' not in response.headers
+        assert 'no-store' in response.headers['Cache-Control']
+
+    finally:
+        os.unlink(config_path)
+
+
+def test_run_all_inside_flask_app_context():
+    from flask import Flask, current_app
+
+    registry = get_registry()
+    registry.clear()
+
+    @check("First app context check")
+    def first_app_check():
+        make_sure(current_app.name == "context_app")
+
+    @check("Second app context check")
+    def second_app_check():
+        make_sure(current_app.name == "context_app")
+
+    app = Flask("context_app")
+    with app.app_context():
+        results = registry.run_all()
+
+    assert all(result.passed for _, result in results), results